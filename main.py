@@ -7,10 +7,22 @@ import json
 from datetime import datetime, timedelta
 import pytz
 import random
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, jsonify, request, Response, stream_with_context
 import threading
 import signal
 import sys
+import glob
+import gzip
+import queue
+import hashlib
+import zlib
+import struct
+from functools import lru_cache
+import argparse
+import tempfile
+import shutil
+import contextlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 CONFIG_FILE = "config.yml"
 
@@ -56,15 +68,101 @@ ALERT_CACHE_FILE = "alert_cache.json"
 ALERT_LOG_FILE = "alert_logs.yml"
 ALERTS_TXT_FILE = f"alerts_{datetime.now().strftime('%Y-%m-%d')}.txt"
 ALERT_COUNTER_FILE = "alert_counter.json"
+LOG_ARCHIVE_DIR = "log_archive"
+LOG_ARCHIVE_CHUNK_ENTRIES = 50
+LOG_ROTATION_INTERVAL_SECONDS = 600
+LOG_ENTRY_SEPARATOR = "="*50 + "\n"
+# Descriptions in alert_logs.yml and today's alerts_*.txt, and raw features in alert_cache.json,
+# are stored only as hashes into this pack, so keep and back up both body_store files with them.
+# Archives in LOG_ARCHIVE_DIR have the text expanded back in and stand on their own.
+BODY_STORE_FILE = "body_store.pack"
+BODY_INDEX_FILE = "body_store.idx"
+BODY_INDEX_RECORD = struct.Struct("<32sQIi")
+BODY_DELTA_CANDIDATES = 512
+BODY_DELTA_MIN_SHARED = 0.3
 
 local_tz = pytz.timezone('America/New_York')
 
-last_error_time = None
-ERROR_RATE_LIMIT_SECONDS = 60 
+ERROR_DIGEST_INTERVAL_SECONDS = 60
+ERROR_DIGEST_MAX_FIELDS = 10
+error_queue = queue.Queue()
+pending_errors = {}
+pending_errors_lock = threading.Lock()
 
 app = Flask(__name__)
 start_time = datetime.now()
 
+PROFILE_MAX_SECONDS = 120
+PROFILE_SAMPLE_INTERVAL = 0.005
+profiling_enabled = False
+profile_lock = threading.Lock()
+stage_stats = {}
+stage_stats_lock = threading.Lock()
+active_stages = {}
+
+class ProfileStage:
+    """Times one pipeline stage and marks it on the thread's stage stack for the sampler."""
+    __slots__ = ("name", "stack", "wall", "cpu")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.stack = active_stages.setdefault(threading.get_ident(), [])
+        self.stack.append(self.name)
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        self.stack.pop()
+        with stage_stats_lock:
+            stats = stage_stats.setdefault(self.name, {"calls": 0, "wall": 0.0, "cpu": 0.0})
+            stats["calls"] += 1
+            stats["wall"] += wall
+            stats["cpu"] += cpu
+        return False
+
+class NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_STAGE = NullStage()
+
+def profile_stage(name):
+    """Context manager around a pipeline stage; a shared no-op unless profiling is enabled."""
+    if not profiling_enabled:
+        return NULL_STAGE
+    return ProfileStage(name)
+
+def sample_stacks(seconds):
+    """Sample every other thread's stack for `seconds`, returning folded stacks (flamegraph.pl / speedscope format)."""
+    samples = {}
+    own_thread = threading.get_ident()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_thread:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            frames.reverse()
+            stages = [f"stage:{name}" for name in list(active_stages.get(ident, []))]
+            stack = ";".join([thread_names.get(ident, str(ident))] + stages + frames)
+            samples[stack] = samples.get(stack, 0) + 1
+        time.sleep(PROFILE_SAMPLE_INTERVAL)
+    return samples
+
 STATE_TIMEZONES = {
     "AL": "America/Chicago",
     "AK": "America/Anchorage",
@@ -193,17 +291,83 @@ def get_alerts():
         with open(ALERT_LOG_FILE, "r", encoding="utf-8") as f:
             logs = yaml.safe_load(f) or []
         filtered_logs = [log for log in logs if log["timestamp"].startswith(date_filter)]
+        for log in filtered_logs:
+            if "details_ref" in log:
+                ref = log.pop("details_ref")
+                details = load_details(ref)
+                log["details"] = details if details is not None else f"(missing body {ref})"
         return jsonify({"alerts": filtered_logs, "count": len(filtered_logs)})
     return jsonify({"alerts": [], "count": 0, "message": "No logs available"})
 
 @app.route("/logs", methods=["GET"])
 def download_logs():
+    range_from = request.args.get("from")
+    range_to = request.args.get("to")
+    if range_from or range_to:
+        now = datetime.now(local_tz).replace(tzinfo=None)
+        try:
+            start = parse_log_range_bound(range_from, end=False) if range_from else None
+            end = parse_log_range_bound(range_to, end=True) if range_to else now
+        except ValueError as e:
+            return jsonify({"status": "Error", "message": str(e)}), 400
+        if start is not None and start > end:
+            return jsonify({"status": "Error", "message": "'from' must not be after 'to'"}), 400
+        days = log_days()
+        if not days:
+            return jsonify({"status": "Error", "message": "No log files available"}), 404
+        # Entries can sit one file away from their stamp's date, so the usable window is
+        # the day before the oldest file through the day after today.
+        earliest = datetime.combine(days[0], datetime.min.time()) - timedelta(days=1)
+        latest = datetime.combine(now.date(), datetime.max.time()).replace(microsecond=0) + timedelta(days=1)
+        if (start is not None and start > latest) or end < earliest:
+            return jsonify({"status": "Error", "message": f"Range must overlap {earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}"}), 400
+        start = max(start or earliest, earliest)
+        end = min(end, latest)
+        filename = f"alerts_{start.strftime('%Y-%m-%d')}_{end.strftime('%Y-%m-%d')}.txt"
+        return Response(
+            stream_with_context(iter_log_range(start, end)),
+            mimetype="text/plain",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
     today = datetime.now().strftime('%Y-%m-%d')
     log_file = f"alerts_{today}.txt"
     if os.path.exists(log_file):
-        return send_file(log_file, as_attachment=True, download_name=f"alerts_{today}.txt")
+        def stream_log_file():
+            with open(log_file, "r") as f:
+                for entry in iter_log_entries(f):
+                    yield expand_log_entry(entry)
+        return Response(
+            stream_with_context(stream_log_file()),
+            mimetype="text/plain",
+            headers={"Content-Disposition": f"attachment; filename=alerts_{today}.txt"}
+        )
     return jsonify({"status": "Error", "message": f"No log file found for {today}"}), 404
 
+@app.route("/debug/profile", methods=["GET"])
+def debug_profile():
+    global profiling_enabled
+    try:
+        seconds = float(request.args.get("seconds", 10))
+    except ValueError:
+        return jsonify({"status": "Error", "message": "seconds must be a number"}), 400
+    seconds = max(PROFILE_SAMPLE_INTERVAL, min(seconds, PROFILE_MAX_SECONDS))
+    if not profile_lock.acquire(blocking=False):
+        return jsonify({"status": "Error", "message": "A profile is already running"}), 409
+    try:
+        with stage_stats_lock:
+            stage_stats.clear()
+        profiling_enabled = True
+        samples = sample_stacks(seconds)
+    finally:
+        profiling_enabled = False
+        profile_lock.release()
+    with stage_stats_lock:
+        stages = {name: dict(stats) for name, stats in stage_stats.items()}
+    if request.args.get("format") == "json":
+        return jsonify({"seconds": seconds, "interval": PROFILE_SAMPLE_INTERVAL, "stages": stages, "samples": samples})
+    folded = "".join(f"{stack} {count}\n" for stack, count in sorted(samples.items()))
+    return Response(folded, mimetype="text/plain", headers={"Content-Disposition": "attachment; filename=profile.folded"})
+
 @app.route("/reload_config", methods=["POST"])
 def reload_config():
     global WEBHOOKS, EMBED_COLORS, ALERT_ICONS, SAFETY_TIPS, WINTER_ALERTS_ENABLED
@@ -242,28 +406,129 @@ def save_alert_cache(cache):
     with open(ALERT_CACHE_FILE, "w") as f:
         json.dump(cache, f)
 
+def cached_alert(entry):
+    """Return the full feature for a retry-cache entry (older entries embed it inline)."""
+    if "alert_ref" in entry:
+        return load_feature(entry["alert_ref"])
+    return entry["alert"]
+
+def load_body_index():
+    """Read the binary index: (sha256, pack offset, compressed length, base record or -1) per blob."""
+    index = {}
+    order = []
+    if os.path.exists(BODY_INDEX_FILE):
+        with open(BODY_INDEX_FILE, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % BODY_INDEX_RECORD.size
+        for digest, offset, length, base in BODY_INDEX_RECORD.iter_unpack(data[:usable]):
+            index[digest.hex()] = (offset, length, base)
+            order.append(digest.hex())
+    return index, order
+
+body_index, body_order = load_body_index()
+body_store_lock = threading.Lock()
+recent_bodies = []
+
+def put_blob(data, base=None):
+    """Append data to the pack file once, keyed by its SHA-256, and return the hash.
+
+    With a base, data is compressed against the base blob as a zlib preset dictionary.
+    Bases are always stored whole, so reading any blob needs at most one extra inflate.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    if digest in body_index:
+        return digest
+    if base is None:
+        compressed = zlib.compress(data, 9)
+    else:
+        compressor = zlib.compressobj(9, zdict=get_blob(base))
+        compressed = compressor.compress(data) + compressor.flush()
+    with body_store_lock:
+        if digest in body_index:
+            return digest
+        base_record = body_order.index(base) if base is not None else -1
+        with open(BODY_STORE_FILE, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(compressed)
+        with open(BODY_INDEX_FILE, "ab") as f:
+            f.write(BODY_INDEX_RECORD.pack(bytes.fromhex(digest), offset, len(compressed), base_record))
+        body_index[digest] = (offset, len(compressed), base_record)
+        body_order.append(digest)
+    return digest
+
+@lru_cache(maxsize=512)
+def get_blob(digest):
+    with body_store_lock:
+        offset, length, base_record = body_index[digest]
+        base = body_order[base_record] if base_record >= 0 else None
+    with open(BODY_STORE_FILE, "rb") as f:
+        f.seek(offset)
+        compressed = f.read(length)
+    if base is None:
+        return zlib.decompress(compressed)
+    decompressor = zlib.decompressobj(zdict=get_blob(base))
+    return decompressor.decompress(compressed) + decompressor.flush()
+
+def store_body(text):
+    """Store a description, delta-compressed against a recent body it mostly repeats (CAP updates)."""
+    paragraphs = {paragraph: len(paragraph) for paragraph in text.split("\n\n")}
+    base = None
+    best_shared = BODY_DELTA_MIN_SHARED * len(text)
+    for ref, candidate in recent_bodies:
+        shared = sum(size for paragraph, size in paragraphs.items() if paragraph in candidate)
+        if shared >= best_shared:
+            base, best_shared = ref, shared
+    ref = put_blob(text.encode("utf-8"), base)
+    if base is None and all(ref != recent for recent, _ in recent_bodies):
+        recent_bodies.append((ref, set(paragraphs)))
+        del recent_bodies[:-BODY_DELTA_CANDIDATES]
+    return ref
+
+def load_body(ref):
+    return get_blob(ref).decode("utf-8")
+
+def store_feature(alert):
+    """Store a raw GeoJSON feature with its description held as a separate body reference."""
+    properties = dict(alert["properties"])
+    if "description" in properties:
+        properties["description_ref"] = store_body(properties.pop("description"))
+    feature = dict(alert, properties=properties)
+    return put_blob(json.dumps(feature, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+def load_feature(ref):
+    feature = json.loads(get_blob(ref))
+    properties = feature["properties"]
+    if "description_ref" in properties:
+        properties["description"] = load_body(properties.pop("description_ref"))
+    return feature
+
+NWS_EVENTS = [
+    "Severe Thunderstorm Watch", "Severe Thunderstorm Warning",
+    "Tornado Watch", "Tornado Warning",
+    "Extreme Heat Warning", "Heat Advisory",
+    "Special Weather Statement"
+]
+WINTER_EVENTS = [
+    "Winter Storm Warning",
+    "Winter Storm Watch",
+    "Winter Weather Advisory",
+    "Snow Squall Warning",
+    "Blizzard Warning"
+]
+
 def fetch_nws_alerts():
-    target_events = [
-        "Severe Thunderstorm Watch", "Severe Thunderstorm Warning",
-        "Tornado Watch", "Tornado Warning",
-        "Extreme Heat Warning", "Heat Advisory",
-        "Special Weather Statement"
-    ]
+    target_events = list(NWS_EVENTS)
     if WINTER_ALERTS_ENABLED:
-        target_events.extend([
-            "Winter Storm Warning",
-            "Winter Storm Watch",
-            "Winter Weather Advisory",
-            "Snow Squall Warning",
-            "Blizzard Warning"
-        ])
+        target_events.extend(WINTER_EVENTS)
     url = NWS_BASE_URL
     headers = {"User-Agent": "MIWXAlerts/1.0 (stroussdevon@gmail.com)"}
     params = {"event": ",".join(target_events)}
     try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        alerts = response.json().get("features", [])
+        with profile_stage("fetch"):
+            response = requests.get(url, headers=headers, params=params)
+            response.raise_for_status()
+        with profile_stage("parse"):
+            alerts = response.json().get("features", [])
         print(f"Fetched {len(alerts)} active alerts for targeted events")
         fetch_nws_alerts.__last_fetch__ = datetime.now().isoformat()
         return alerts
@@ -331,7 +596,6 @@ def send_discord_alert(event_type, alert, tornado_possible=False, is_update=Fals
         return
 
     webhook_url = WEBHOOKS[event_type]
-    embed_color = EMBED_COLORS.get(event_type, 0x000000)
     
     title = alert["properties"]["event"]
     if tornado_possible:
@@ -347,18 +611,50 @@ def send_discord_alert(event_type, alert, tornado_possible=False, is_update=Fals
     sender_name = alert["properties"].get("senderName", "National Weather Service")
     timestamp = convert_to_local_time(sent_raw) if sent_raw else "Unknown Time"
 
-    multi_state_text, alert_tz = extract_states_and_timezone(area)
-    location_text = multi_state_text if multi_state_text else area
-    expires_time = format_time_with_tz(expires_raw, alert_tz) if expires_raw else "Unknown Time"
-    
+    with profile_stage("geo"):
+        multi_state_text, alert_tz = extract_states_and_timezone(area)
+        location_text = multi_state_text if multi_state_text else area
+        expires_time = format_time_with_tz(expires_raw, alert_tz) if expires_raw else "Unknown Time"
+
     alert_type = "WATCH" if "Watch" in event_type else "WARNING"
     formatted_description = (
         f"THE NATIONAL WEATHER SERVICE HAS ISSUED {alert_type} IN EFFECT UNTIL "
         f"{expires_time} THIS EVENING FOR THE FOLLOWING AREAS\n\n{location_text}\n\n{description}"
     )
 
-    alert_number = get_alert_number(event_type)
-    
+    with profile_stage("persist"):
+        alert_number = get_alert_number(event_type)
+    with profile_stage("geo"):
+        city_text, has_cities = get_cities_for_counties(area, description)
+
+    with profile_stage("embed"):
+        payload = build_alert_payload(event_type, title, alert_number, formatted_description, location_text,
+                                      sender_name, nws_url, description, city_text, has_cities)
+
+    try:
+        with profile_stage("post"):
+            response = requests.post(webhook_url, json=payload)
+            response.raise_for_status()
+        print(f"Sent alert: {title} [{alert_number}] to {event_type} channel{' (update)' if is_update else ''}")
+        with profile_stage("persist"):
+            body_ref = store_body(description)
+        with profile_stage("log_alert"):
+            log_alert(event_type, event_type, area, body_ref, nws_url, timestamp)
+        alert_id = alert["id"]
+        sent_alerts[alert_id] = {"sent": timestamp, "event_type": event_type}
+        with profile_stage("persist"):
+            save_sent_data()
+    except requests.exceptions.RequestException as e:
+        send_error_log(f"Error sending alert for {event_type}: {str(e)}")
+        with profile_stage("persist"):
+            cache = load_alert_cache()
+            cache.append({"event_type": event_type, "alert_id": alert["id"], "alert_ref": store_feature(alert), "tornado_possible": tornado_possible, "timestamp": datetime.now(local_tz).isoformat()})
+            save_alert_cache(cache)
+        print(f"Cached alert {alert['id']} for retry")
+
+def build_alert_payload(event_type, title, alert_number, formatted_description, location_text, sender_name, nws_url, description, city_text, has_cities):
+    """Build the Discord webhook payload (embeds and role ping) for an alert."""
+    embed_color = EMBED_COLORS.get(event_type, 0x000000)
     warning_types_with_details = [
         "Severe Thunderstorm Warning", "Tornado Warning", 
         "PDS Tornado Warning", "Tornado Emergency", "Tornado Observed",
@@ -409,7 +705,6 @@ def send_discord_alert(event_type, alert, tornado_possible=False, is_update=Fals
         if hail_size != "N/A":
             fields.insert(4, {"name": "❄️ Hail Size", "value": hail_size, "inline": True})
 
-    city_text, has_cities = get_cities_for_counties(area, description)
     embeds = []
     
     embed_1 = {
@@ -471,21 +766,7 @@ def send_discord_alert(event_type, alert, tornado_possible=False, is_update=Fals
     else:
         role_id = ROLE_IDS.get(event_type, "")
         payload = {"content": f"<@&{role_id}>", "embeds": embeds}
-
-    try:
-        response = requests.post(webhook_url, json=payload)
-        response.raise_for_status()
-        print(f"Sent alert: {title} [{alert_number}] to {event_type} channel{' (update)' if is_update else ''}")
-        log_alert(event_type, event_type, area, description, nws_url, timestamp)
-        alert_id = alert["id"]
-        sent_alerts[alert_id] = {"sent": timestamp, "event_type": event_type}
-        save_sent_data()
-    except requests.exceptions.RequestException as e:
-        send_error_log(f"Error sending alert for {event_type}: {str(e)}")
-        cache = load_alert_cache()
-        cache.append({"event_type": event_type, "alert": alert, "tornado_possible": tornado_possible, "timestamp": datetime.now(local_tz).isoformat()})
-        save_alert_cache(cache)
-        print(f"Cached alert {alert['id']} for retry")
+    return payload
 
 def retry_cached_alerts():
     cache = load_alert_cache()
@@ -494,25 +775,92 @@ def retry_cached_alerts():
     new_cache = []
     for entry in cache:
         try:
-            send_discord_alert(entry["event_type"], entry["alert"], entry["tornado_possible"])
+            send_discord_alert(entry["event_type"], cached_alert(entry), entry["tornado_possible"])
         except Exception as e:
-            send_error_log(f"Retry failed for cached alert {entry['alert']['id']}: {str(e)}")
+            alert_id = entry.get("alert_id") or entry.get("alert", {}).get("id", "unknown")
+            send_error_log(f"Retry failed for cached alert {alert_id}: {str(e)}")
             new_cache.append(entry)
     save_alert_cache(new_cache)
 
 def send_error_log(message):
-    global last_error_time
-    now = time.time()
-    if last_error_time is None or (now - last_error_time) >= ERROR_RATE_LIMIT_SECONDS:
-        payload = {"content": f"Error: {message}"}
+    """Queue an error for the next digest; never blocks the caller on the network."""
+    print(f"Error: {message}")
+    error_queue.put((message, datetime.now(local_tz)))
+
+def error_signature(message):
+    """Collapse the variable parts of a message (URLs, ids, counts) so repeats group together."""
+    signature = re.sub(r"https?://\S+", "<url>", message)
+    return re.sub(r"\d+", "#", signature)
+
+def record_error(message, seen, count=1, first_seen=None):
+    signature = error_signature(message)
+    with pending_errors_lock:
+        entry = pending_errors.get(signature)
+        if entry is None:
+            pending_errors[signature] = {"message": message, "count": count, "first_seen": first_seen or seen, "last_seen": seen}
+        else:
+            entry["count"] += count
+            entry["first_seen"] = min(entry["first_seen"], first_seen or seen)
+            if seen >= entry["last_seen"]:
+                entry["last_seen"] = seen
+                entry["message"] = message
+
+def drain_error_queue():
+    while True:
         try:
-            response = requests.post(ERROR_WEBHOOK_URL, json=payload)
-            response.raise_for_status()
-            last_error_time = now
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to send error log: {str(e)}")
-    else:
-        print(f"Error log rate-limited: {message}")
+            message, seen = error_queue.get_nowait()
+        except queue.Empty:
+            return
+        record_error(message, seen)
+
+def build_error_digest(digest):
+    entries = sorted(digest.values(), key=lambda entry: entry["count"], reverse=True)
+    total = sum(entry["count"] for entry in entries)
+    first_seen = min(entry["first_seen"] for entry in entries)
+    summary = f"{total} error(s), {len(entries)} distinct, since {first_seen.strftime('%Y-%m-%d %H:%M:%S %Z')}"
+    if len(entries) > ERROR_DIGEST_MAX_FIELDS:
+        summary += f"\nShowing the {ERROR_DIGEST_MAX_FIELDS} most frequent; {len(entries) - ERROR_DIGEST_MAX_FIELDS} more omitted."
+    fields = []
+    for entry in entries[:ERROR_DIGEST_MAX_FIELDS]:
+        message = entry["message"] if len(entry["message"]) <= 300 else entry["message"][:297] + "..."
+        fields.append({
+            "name": f"{entry['count']}x",
+            "value": f"{message}\nFirst: {entry['first_seen'].strftime('%H:%M:%S')} | Last: {entry['last_seen'].strftime('%H:%M:%S')}",
+            "inline": False
+        })
+    embed = {"title": "⚠️ MIWXAlerts Error Digest", "description": summary, "color": 0xff0000, "fields": fields, "timestamp": datetime.now(local_tz).isoformat()}
+    return {"embeds": [embed]}
+
+def flush_error_digest():
+    """Post every pending error as one digest embed; keep them pending if the post fails."""
+    drain_error_queue()
+    with pending_errors_lock:
+        if not pending_errors:
+            return
+        digest = dict(pending_errors)
+        pending_errors.clear()
+    try:
+        response = requests.post(ERROR_WEBHOOK_URL, json=build_error_digest(digest), timeout=10)
+        response.raise_for_status()
+        print(f"Sent error digest with {sum(entry['count'] for entry in digest.values())} errors")
+    except requests.exceptions.RequestException as e:
+        print(f"Failed to send error digest: {str(e)}")
+        for entry in digest.values():
+            record_error(entry["message"], entry["last_seen"], entry["count"], entry["first_seen"])
+
+def error_digest_worker():
+    while True:
+        deadline = time.time() + ERROR_DIGEST_INTERVAL_SECONDS
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                message, seen = error_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            record_error(message, seen)
+        flush_error_digest()
 
 def send_daily_summary():
     while True:
@@ -638,12 +986,12 @@ def check_for_tornado_possible(alert):
         print(f"Tornado Possible detected for alert {alert['id']}")
     return is_tornado_possible
 
-def log_alert(event_type, event, area, description, nws_url, timestamp):
+def log_alert(event_type, event, area, details_ref, nws_url, timestamp):
     alert_data = {
         "timestamp": timestamp,
         "event": event,
         "location": area,
-        "details": description,
+        "details_ref": details_ref,
         "url": nws_url
     }
 
@@ -667,8 +1015,179 @@ def log_alert(event_type, event, area, description, nws_url, timestamp):
 
     with open(ALERTS_TXT_FILE, "a") as file:
         file.write(f"{timestamp} - {event} [{area}]\n")
-        file.write(f"Details: {description}\n")
-        file.write("="*50 + "\n")
+        file.write(f"Details-Ref: {details_ref}\n")
+        file.write(LOG_ENTRY_SEPARATOR)
+
+def iter_log_entries(lines):
+    """Group raw log lines into complete entries (descriptions can span several lines)."""
+    entry = []
+    for line in lines:
+        entry.append(line)
+        if line == LOG_ENTRY_SEPARATOR:
+            yield "".join(entry)
+            entry = []
+    if entry:
+        yield "".join(entry)
+
+def load_details(ref):
+    """Return the stored description for ref, or None if the body store can't produce it."""
+    try:
+        return load_body(ref)
+    except (KeyError, OSError, ValueError, zlib.error):
+        return None
+
+def expand_log_entry(entry, keep_missing_ref=False):
+    """Swap a Details-Ref line for the stored description text."""
+    head, sep, rest = entry.partition("\nDetails-Ref: ")
+    if not sep:
+        return entry
+    ref, _, tail = rest.partition("\n")
+    details = load_details(ref)
+    if details is None:
+        if keep_missing_ref:
+            return entry
+        details = f"(missing body {ref})"
+    return f"{head}\nDetails: {details}\n{tail}"
+
+def log_entry_timestamp(entry):
+    """Return the entry's 'YYYY-MM-DD HH:MM:SS' timestamp, or None if it was logged as Unknown Time."""
+    stamp = entry[:19]
+    try:
+        datetime.strptime(stamp, '%Y-%m-%d %H:%M:%S')
+        return stamp
+    except ValueError:
+        return None
+
+def archive_paths(day):
+    base = os.path.join(LOG_ARCHIVE_DIR, f"alerts_{day}")
+    return f"{base}.txt.gz", f"{base}.idx.json"
+
+def archive_log_file(log_file, day):
+    """Compress a finished day's log into a gzip archive plus an offset index.
+
+    Details-Ref lines are expanded back into the description text so the archive
+    stays readable without body_store.pack.
+
+    Entries are written in chunks of LOG_ARCHIVE_CHUNK_ENTRIES, each as its own gzip
+    member, so the archive still decompresses with plain gunzip while a range read
+    only has to inflate the chunks that overlap the requested window. If the day was
+    already archived (a late write after rotation), the new chunks are appended to it.
+    """
+    os.makedirs(LOG_ARCHIVE_DIR, exist_ok=True)
+    archive_file, index_file = archive_paths(day)
+    index = []
+    if os.path.exists(archive_file) and os.path.exists(index_file):
+        with open(index_file, "r") as f:
+            index = json.load(f)["chunks"]
+        shutil.copyfile(archive_file, archive_file + ".tmp")
+    elif os.path.exists(archive_file + ".tmp"):
+        os.remove(archive_file + ".tmp")
+
+    def write_chunk(out, chunk):
+        stamps = [s for s in (log_entry_timestamp(e) for e in chunk) if s]
+        data = gzip.compress("".join(chunk).encode("utf-8"))
+        index.append({
+            "offset": out.tell(),
+            "length": len(data),
+            "first": min(stamps) if stamps else None,
+            "last": max(stamps) if stamps else None,
+            "untimed": len(chunk) - len(stamps)
+        })
+        out.write(data)
+
+    with open(log_file, "r") as src, open(archive_file + ".tmp", "ab") as out:
+        chunk = []
+        for entry in iter_log_entries(src):
+            chunk.append(expand_log_entry(entry, keep_missing_ref=True))
+            if len(chunk) >= LOG_ARCHIVE_CHUNK_ENTRIES:
+                write_chunk(out, chunk)
+                chunk = []
+        if chunk:
+            write_chunk(out, chunk)
+
+    # Existing chunks keep their offsets, so the old index stays valid until it is replaced.
+    os.replace(archive_file + ".tmp", archive_file)
+    with open(index_file + ".tmp", "w") as f:
+        json.dump({"day": day, "chunks": index}, f)
+    os.replace(index_file + ".tmp", index_file)
+    os.remove(log_file)
+    print(f"Archived {log_file} to {archive_file} ({len(index)} chunks)")
+
+def rotate_logs():
+    """Archive every daily text log except today's."""
+    today = datetime.now().strftime('%Y-%m-%d')
+    for log_file in sorted(glob.glob("alerts_????-??-??.txt")):
+        day = log_file[len("alerts_"):-len(".txt")]
+        if day >= today:
+            continue
+        try:
+            archive_log_file(log_file, day)
+        except Exception as e:
+            send_error_log(f"Failed to archive {log_file}: {str(e)}")
+
+def log_rotation_worker():
+    while True:
+        rotate_logs()
+        time.sleep(LOG_ROTATION_INTERVAL_SECONDS)
+
+def parse_log_range_bound(value, end=False):
+    """Parse a /logs range bound; a bare date covers the whole day."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("T", " "))
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD or YYYY-MM-DD HH:MM:SS")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(local_tz).replace(tzinfo=None)
+    if end and len(value) == 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed
+
+def log_days():
+    """Sorted dates that have an archived or live daily log file."""
+    days = set()
+    for path in glob.glob(os.path.join(LOG_ARCHIVE_DIR, "alerts_????-??-??.txt.gz")) + glob.glob("alerts_????-??-??.txt"):
+        try:
+            days.add(datetime.strptime(os.path.basename(path)[len("alerts_"):len("alerts_") + 10], '%Y-%m-%d').date())
+        except ValueError:
+            continue
+    return sorted(days)
+
+def iter_log_range(start, end):
+    """Stream log entries between start and end, one day file and one archive chunk at a time.
+
+    Files are named by the host's date when the entry was written, while entries carry the
+    alert's sent time in local_tz (and retried alerts can be written after midnight), so the
+    neighbouring day file on each side is scanned too; the chunk index keeps that cheap.
+    Untimed entries are only returned from files dated inside the range.
+    """
+    first = start.strftime('%Y-%m-%d %H:%M:%S')
+    last = end.strftime('%Y-%m-%d %H:%M:%S')
+    for day in log_days():
+        if (day - start.date()).days < -1 or (day - end.date()).days > 1:
+            continue
+        include_untimed = start.date() <= day <= end.date()
+        day_str = day.strftime('%Y-%m-%d')
+        archive_file, index_file = archive_paths(day_str)
+        if os.path.exists(archive_file) and os.path.exists(index_file):
+            with open(index_file, "r") as f:
+                chunks = json.load(f)["chunks"]
+            with open(archive_file, "rb") as f:
+                for chunk in chunks:
+                    in_range = chunk["first"] and chunk["first"] <= last and chunk["last"] >= first
+                    if not in_range and not (include_untimed and chunk["untimed"]):
+                        continue
+                    f.seek(chunk["offset"])
+                    text = gzip.decompress(f.read(chunk["length"])).decode("utf-8")
+                    for entry in iter_log_entries(text.splitlines(keepends=True)):
+                        stamp = log_entry_timestamp(entry)
+                        if (include_untimed if stamp is None else first <= stamp <= last):
+                            yield expand_log_entry(entry)
+        elif os.path.exists(f"alerts_{day_str}.txt"):
+            with open(f"alerts_{day_str}.txt", "r") as f:
+                for entry in iter_log_entries(f):
+                    stamp = log_entry_timestamp(entry)
+                    if (include_untimed if stamp is None else first <= stamp <= last):
+                        yield expand_log_entry(entry)
 
 def check_for_alerts():
     global sent_alerts
@@ -691,16 +1210,17 @@ def check_for_alerts():
             continue
 
         tornado_possible = False
-        if event_type == "Severe Thunderstorm Warning":
-            tornado_possible = check_for_tornado_possible(alert)
-
-        if event_type == "Tornado Warning":
-            if check_for_tornado_emergency(alert):
-                event_type = "Tornado Emergency"
-            elif check_for_pds_tornado_warning(alert):
-                event_type = "PDS Tornado Warning"
-            elif check_for_tornado_observed(alert):
-                event_type = "Tornado Observed"
+        with profile_stage("classify"):
+            if event_type == "Severe Thunderstorm Warning":
+                tornado_possible = check_for_tornado_possible(alert)
+
+            if event_type == "Tornado Warning":
+                if check_for_tornado_emergency(alert):
+                    event_type = "Tornado Emergency"
+                elif check_for_pds_tornado_warning(alert):
+                    event_type = "PDS Tornado Warning"
+                elif check_for_tornado_observed(alert):
+                    event_type = "Tornado Observed"
 
         if event_type in WEBHOOKS:
             if alert_id not in sent_alerts:
@@ -713,6 +1233,262 @@ def check_for_alerts():
                 print(f"Skipping update for {alert_id}: No escalation to PDS/Emergency (from {original_event} to {event_type})")
                 continue
 
+LOAD_TEST_EVENT_MIX = {
+    "Severe Thunderstorm Warning": 45,
+    "Tornado Warning": 30,
+    "Severe Thunderstorm Watch": 5,
+    "Tornado Watch": 5,
+    "Special Weather Statement": 15
+}
+LOAD_TEST_STATES = ["AL", "MS", "TN", "GA", "KY", "AR", "LA", "OK", "TX", "MO", "IL", "IN", "OH", "MI"]
+LOAD_TEST_SYLLABLES = ["ash", "bur", "cal", "den", "el", "fair", "glen", "har", "iron", "jack", "king", "lin",
+                       "mar", "new", "oak", "pine", "ridge", "sal", "tus", "vale", "wood", "york"]
+
+def synthetic_place(rng):
+    return "".join(rng.choice(LOAD_TEST_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+def synthetic_description(rng, event_type, length, places):
+    """Build NWS-style description paragraphs for event_type, padded to roughly `length` characters."""
+    issued = f"{rng.randint(1, 11)}:{rng.randint(0, 59):02d} PM CDT"
+    direction = rng.choice(["north", "northeast", "east", "southeast"])
+    speed = rng.randint(25, 65)
+    if event_type == "Tornado Warning":
+        paragraphs = [
+            f"At {issued}, a severe thunderstorm capable of producing a tornado was located near {places[0]}, "
+            f"moving {direction} at {speed} mph.",
+            f"HAZARD...Tornado and {rng.choice(['quarter', 'ping pong ball', 'golf ball'])} size hail.",
+            "SOURCE...Radar indicated rotation.",
+            "IMPACT...Flying debris will be dangerous to those caught without shelter. Mobile homes will be "
+            "damaged or destroyed. Damage to roofs, windows, and vehicles will occur."
+        ]
+        roll = rng.random()
+        if roll < 0.05:
+            paragraphs.insert(0, f"...TORNADO EMERGENCY FOR {places[0].upper()}...")
+            paragraphs[2] = "SOURCE...Weather spotters confirmed tornado."
+        elif roll < 0.15:
+            paragraphs.insert(0, "THIS IS A PARTICULARLY DANGEROUS SITUATION. TAKE COVER NOW!")
+        elif roll < 0.45:
+            paragraphs[2] = "SOURCE...Weather spotters confirmed tornado."
+        locations = "Locations impacted include..."
+    elif event_type == "Severe Thunderstorm Warning":
+        paragraphs = [
+            f"At {issued}, a severe thunderstorm was located near {places[0]}, moving {direction} at {speed} mph.",
+            f"HAZARD...{rng.choice([60, 70, 80])} mph wind gusts and {rng.choice(['1.00', '1.75', '2.75'])} inch hail.",
+            "SOURCE...Radar indicated.",
+            "IMPACT...Expect damage to roofs, siding, and trees. Mobile homes will be heavily damaged."
+        ]
+        if rng.random() < 0.2:
+            paragraphs.append("TORNADO...POSSIBLE")
+        locations = "Locations impacted include..."
+    elif event_type in ["Severe Thunderstorm Watch", "Tornado Watch"]:
+        paragraphs = [
+            f"{event_type.upper()} {rng.randint(100, 499)} REMAINS VALID UNTIL {rng.randint(8, 11)} PM CDT "
+            "THIS EVENING FOR THE FOLLOWING AREAS"
+        ]
+        locations = f"THIS WATCH INCLUDES {rng.randint(10, 40)} COUNTIES IN THE FOLLOWING AREAS..."
+    elif event_type == "Special Weather Statement":
+        paragraphs = [
+            f"At {issued}, Doppler radar was tracking a strong thunderstorm near {places[0]}, "
+            f"moving {direction} at {rng.randint(15, 35)} mph.",
+            f"HAZARD...Winds in excess of {rng.choice([40, 45, 50])} mph and {rng.choice(['pea', 'half inch'])} size hail.",
+            "SOURCE...Radar indicated.",
+            "IMPACT...Gusty winds could knock down tree limbs and blow around unsecured objects."
+        ]
+        locations = "Locations impacted include..."
+    elif event_type in ["Extreme Heat Warning", "Heat Advisory"]:
+        heat_index = rng.randint(105, 118) if event_type == "Extreme Heat Warning" else rng.randint(100, 108)
+        paragraphs = [
+            f"* WHAT...Heat index values up to {heat_index} expected.",
+            "* WHEN...From noon today to 8 PM CDT this evening.",
+            "* IMPACTS...Hot temperatures and high humidity may cause heat illnesses."
+        ]
+        locations = "* WHERE..."
+    elif event_type == "Snow Squall Warning":
+        paragraphs = [
+            f"At {issued}, a dangerous snow squall was located along a line extending from {places[0]} "
+            f"to {places[-1]}, moving {direction} at {speed} mph.",
+            "HAZARD...Sudden whiteout conditions with zero visibility. Strong winds and rapid snow accumulation.",
+            "SOURCE...Radar and surface observations.",
+            "IMPACT...Travel will be extremely dangerous. Expect roads to become snow covered and icy quickly."
+        ]
+        locations = "Locations impacted include..."
+    else:
+        snow = rng.randint(2, 4) if event_type == "Winter Weather Advisory" else rng.randint(6, 14)
+        headline = {
+            "Winter Storm Watch": "Heavy snow possible.",
+            "Winter Weather Advisory": "Snow and patchy freezing drizzle expected.",
+            "Blizzard Warning": "Blizzard conditions expected."
+        }.get(event_type, "Heavy snow expected.")
+        paragraphs = [
+            f"* WHAT...{headline} Total snow accumulations of {snow} to {snow + 4} inches. "
+            f"Winds gusting as high as {rng.choice([30, 40, 50])} mph.",
+            "* WHEN...From 6 PM this evening to noon CST Thursday.",
+            "* IMPACTS...Travel could be very difficult. Patchy blowing snow could significantly reduce visibility."
+        ]
+        locations = "* WHERE..."
+    while sum(len(p) + 2 for p in paragraphs) + len(locations) < length:
+        locations += f" {rng.choice(places)},"
+    paragraphs.append(locations.rstrip(",") + ".")
+    return "\n\n".join(paragraphs)
+
+def generate_synthetic_outbreak(count, event_mix=None, description_length=1500, area_count=6, states=None, seed=None, start_id=0):
+    """Generate a GeoJSON FeatureCollection shaped like an NWS /alerts/active response."""
+    rng = random.Random(seed)
+    event_mix = event_mix or LOAD_TEST_EVENT_MIX
+    states = states or LOAD_TEST_STATES
+    events = list(event_mix.keys())
+    weights = list(event_mix.values())
+    now = datetime.now(pytz.utc)
+    features = []
+    for n in range(start_id, start_id + count):
+        event_type = rng.choices(events, weights)[0]
+        alert_states = rng.sample(states, min(len(states), rng.choice([1, 1, 1, 2, 3])))
+        counties = [f"{synthetic_place(rng)}, {rng.choice(alert_states)}" for _ in range(area_count)]
+        places = [synthetic_place(rng) for _ in range(max(area_count * 3, 5))]
+        alert_url = f"https://api.weather.gov/alerts/urn:oid:2.49.0.1.840.0.loadtest.{n}"
+        features.append({
+            "id": alert_url,
+            "type": "Feature",
+            "properties": {
+                "@id": alert_url,
+                "areaDesc": "; ".join(counties),
+                "sent": now.isoformat(),
+                "expires": (now + timedelta(minutes=rng.choice([30, 45, 60, 360]))).isoformat(),
+                "status": "Actual",
+                "messageType": "Alert",
+                "event": event_type,
+                "senderName": f"NWS {synthetic_place(rng)} {alert_states[0]}",
+                "headline": f"{event_type} issued by NWS",
+                "description": synthetic_description(rng, event_type, description_length, places)
+            }
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+def start_load_test_stub():
+    """Serve the synthetic NWS feed on GET and accept webhook POSTs like Discord does."""
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = self.server.feed if self.path.startswith("/alerts/active") else b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/geo+json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.server.posts += 1
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.feed = b'{"features": []}'
+    server.posts = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def parse_event_mix(value):
+    mix = {}
+    for item in value.split(","):
+        event, _, weight = item.partition("=")
+        mix[event.strip()] = float(weight) if weight else 1.0
+    unknown = set(mix) - set(NWS_EVENTS) - set(WINTER_EVENTS)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Unknown NWS event type(s): {', '.join(sorted(unknown))}. "
+            "PDS, Emergency and Observed variants are derived from Tornado Warning descriptions."
+        )
+    return mix
+
+def parse_states(value):
+    states = [state.strip().upper() for state in value.split(",")]
+    unknown = set(states) - STATE_ABBREVS
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown state abbreviation(s): {', '.join(sorted(unknown))}")
+    return states
+
+def run_load_test(args):
+    """Drive synthetic outbreaks through check_for_alerts against a local stub webhook."""
+    global WEBHOOKS, WINTER_ALERTS_ENABLED, NWS_BASE_URL, ERROR_WEBHOOK_URL, sent_alerts, alert_counter, body_index, body_order, recent_bodies, profiling_enabled
+    original_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="miwxalerts-loadtest-")
+    os.chdir(work_dir)
+    server = start_load_test_stub()
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+    NWS_BASE_URL = f"{stub_url}/alerts/active?area=MI"
+    ERROR_WEBHOOK_URL = f"{stub_url}/errors"
+    WEBHOOKS = {event_type: f"{stub_url}/webhook/{event_type.replace(' ', '')}" for event_type in ROLE_IDS}
+    WINTER_ALERTS_ENABLED = any(event_type in WINTER_EVENTS for event_type in args.event_mix)
+    sent_alerts = {}
+    alert_counter = load_alert_counter()
+    body_index, body_order = load_body_index()
+    recent_bodies = []
+    get_blob.cache_clear()
+
+    with stage_stats_lock:
+        stage_stats.clear()
+    profiling_enabled = True
+
+    print(f"Load test: {args.rounds} round(s) x {args.alerts} alerts, {args.areas} areas, ~{args.description_length} char descriptions")
+    elapsed = 0.0
+    cpu = 0.0
+    output = sys.stdout if args.verbose else open(os.devnull, "w")
+    try:
+        for round_number in range(args.rounds):
+            outbreak = generate_synthetic_outbreak(
+                args.alerts, args.event_mix, args.description_length, args.areas, args.states,
+                seed=None if args.seed is None else args.seed + round_number, start_id=round_number * args.alerts
+            )
+            server.feed = json.dumps(outbreak).encode("utf-8")
+            started = time.perf_counter()
+            cpu_started = time.thread_time()
+            with contextlib.redirect_stdout(output):
+                check_for_alerts()
+            elapsed += time.perf_counter() - started
+            cpu += time.thread_time() - cpu_started
+    finally:
+        profiling_enabled = False
+        server.shutdown()
+        if output is not sys.stdout:
+            output.close()
+        os.chdir(original_dir)
+        if args.keep:
+            print(f"Kept load test state files in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_text = f"{peak / (1024 * 1024):.1f} MiB" if sys.platform == "darwin" else f"{peak / 1024:.1f} MiB"
+    except ImportError:
+        peak_text = "unavailable on this platform"
+
+    print(f"Alerts sent: {len(sent_alerts)} ({server.posts} webhook POSTs)")
+    print(f"Throughput: {len(sent_alerts) / elapsed if elapsed else 0:.1f} alerts/sec over {elapsed:.2f}s wall, {cpu:.2f}s CPU")
+    print(f"Memory high-water mark: {peak_text}")
+    print("Per-stage CPU time:")
+    for stage, stats in sorted(stage_stats.items(), key=lambda item: item[1]["cpu"], reverse=True):
+        print(f"  {stage:<10} {stats['calls']:6d} calls {stats['cpu']:8.3f}s  {stats['cpu'] / cpu if cpu else 0:6.1%}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MIWXAlerts NWS to Discord alert bot")
+    parser.add_argument("--load-test", action="store_true", help="run a synthetic outbreak through the pipeline against a local stub webhook and exit; "
+                        "config.yml is still read at startup, though its webhooks are replaced by the stub")
+    parser.add_argument("--alerts", type=int, default=300, help="alerts per synthetic feed (load test)")
+    parser.add_argument("--rounds", type=int, default=3, help="number of synthetic feeds to process (load test)")
+    parser.add_argument("--description-length", type=int, default=1500, help="approximate description length in characters (load test)")
+    parser.add_argument("--areas", type=int, default=6, help="counties per alert (load test)")
+    parser.add_argument("--states", type=parse_states, default=LOAD_TEST_STATES, help="comma separated state abbreviations (load test)")
+    parser.add_argument("--event-mix", type=parse_event_mix, default=LOAD_TEST_EVENT_MIX, help="weights such as 'Tornado Warning=30,Severe Thunderstorm Warning=70' (load test)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible feeds (load test)")
+    parser.add_argument("--keep", action="store_true", help="keep the load test's temporary state directory and print its path")
+    parser.add_argument("--verbose", action="store_true", help="keep per-alert pipeline output during the load test")
+    return parser.parse_args()
+
 def run_flask():
     app.run(host="0.0.0.0", port=5000)
 
@@ -722,11 +1498,20 @@ def signal_handler(sig, frame):
     save_alert_cache(load_alert_cache())
     save_alert_counter(alert_counter)
     send_error_log("Shutting down gracefully.")
+    flush_error_digest()
     sys.exit(0)
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.load_test:
+        run_load_test(args)
+        sys.exit(0)
+
     signal.signal(signal.SIGINT, signal_handler)
 
+    error_digest_thread = threading.Thread(target=error_digest_worker, daemon=True)
+    error_digest_thread.start()
+
     print(f"Starting alert monitoring at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     load_sent_data()
 
@@ -755,6 +1540,9 @@ if __name__ == "__main__":
     health_thread = threading.Thread(target=send_health_ping, daemon=True)
     health_thread.start()
 
+    rotation_thread = threading.Thread(target=log_rotation_worker, daemon=True)
+    rotation_thread.start()
+
     while True:
         try:
             check_for_alerts()